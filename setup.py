@@ -1,8 +1,14 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
 import pathlib
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
+
+try:
+    from Cython.Build import cythonize
+except ImportError:  # The compiled Gnomonic kernel is optional
+    cythonize = None
 
 # The directory containing this file
 HERE = pathlib.Path(__file__).parent
@@ -10,6 +16,33 @@ HERE = pathlib.Path(__file__).parent
 # Text of the README file (if you want to include it on PyPI)
 README = (HERE / "README.md").read_text() if (HERE / "README.md").exists() else ""
 
+# Optional compiled forward Gnomonic kernel. It is only built when Cython is installed, and
+# build failures (e.g. no C compiler or OpenMP) fall back to the Numba/NumPy kernels.
+# By default the kernel targets the compiler's baseline ISA, so wheels run on any CPU of the
+# target architecture (on x86-64, libmvec's SSE2 variants are used). Source installs can opt in
+# to wider SIMD with e.g. SPHERICAL_PROJECTIONS_MARCH=native or =x86-64-v3 (AVX2); binaries
+# built that way must not be distributed to machines lacking those instructions.
+fast_compile_args = ["-O3", "-ffast-math", "-fopenmp"]
+march = os.environ.get("SPHERICAL_PROJECTIONS_MARCH")
+if march:
+    fast_compile_args.append(f"-march={march}")
+
+ext_modules = []
+if cythonize is not None:
+    ext_modules = cythonize(
+        [
+            Extension(
+                "spherical_projections.gnomonic._gnomonic_fast",
+                ["spherical_projections/gnomonic/_gnomonic_fast.pyx"],
+                extra_compile_args=fast_compile_args,
+                extra_link_args=["-fopenmp"],
+                libraries=["m"],  # libm's linker script pulls in libmvec for the SIMD sin calls
+                optional=True,
+            )
+        ],
+        language_level=3,
+    )
+
 setup(
     name="spherical_projection",                # Package name (change as appropriate)
     version="0.1.0-beta",                           # Package version
@@ -21,6 +54,7 @@ setup(
     url="https://github.com/RobinsonGarcia/ProjectionRegistry/",  # Project URL
     packages=find_packages(exclude=["tests*", "docs*", "examples*"]),  
     include_package_data=True,                 # If you have non-Python files to include
+    ext_modules=ext_modules,
     python_requires=">=3.7",                   # Python version requirement
     install_requires=[
         "numpy>=1.20.0",
@@ -29,6 +63,10 @@ setup(
         "opencv-python>=4.5.0",
         # Add any other required dependencies here
     ],
+    extras_require={
+        # Optional accelerated kernels; the NumPy paths are used when absent.
+        "fast": ["numba>=0.56", "numexpr>=2.7"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "Operating System :: OS Independent",
@@ -12,6 +12,8 @@ from .strategy import BaseProjectionStrategy
 from .grid import BaseGridGeneration
 from .interpolation import BaseInterpolation
 from .transform import BaseCoordinateTransformer
+from .mask import PackedMask
+from .scratch import ScratchPool
 from ..exceptions import (
     ProjectionError,
     ConfigurationError,
@@ -28,6 +30,8 @@ __all__ = [
     "BaseGridGeneration",
     "BaseInterpolation",
     "BaseCoordinateTransformer",
+    "PackedMask",
+    "ScratchPool",
     "ProjectionError",
     "ConfigurationError",
     "RegistrationError",
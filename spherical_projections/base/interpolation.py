@@ -1,10 +1,11 @@
 # /Users/robinsongarcia/projects/gnomonic/projection/base/interpolation.py
 
-from typing import Any, Optional
+from typing import Any, Optional, Union
 import cv2
 import numpy as np
 import logging
 from ..exceptions import InterpolationError
+from .mask import PackedMask
 
 # Initialize logger for this module
 logger = logging.getLogger('gnomonic_projection.base.interpolation')
@@ -37,7 +38,7 @@ class BaseInterpolation:
         input_img: np.ndarray, 
         map_x: np.ndarray, 
         map_y: np.ndarray, 
-        mask: Optional[np.ndarray] = None
+        mask: Optional[Union[np.ndarray, PackedMask]] = None
     ) -> np.ndarray:
         """
         Perform image interpolation based on the provided mapping.
@@ -46,7 +47,8 @@ class BaseInterpolation:
             input_img (np.ndarray): The input image to interpolate.
             map_x (np.ndarray): The mapping for the x-coordinates.
             map_y (np.ndarray): The mapping for the y-coordinates.
-            mask (Optional[np.ndarray], optional): Mask to apply to the interpolated image. Defaults to None.
+            mask (Optional[Union[np.ndarray, PackedMask]], optional): Mask to apply to the interpolated image.
+                Packed masks are unpacked here, right before being applied. Defaults to None.
 
         Returns:
             np.ndarray: The interpolated image.
@@ -65,8 +67,8 @@ class BaseInterpolation:
             raise InterpolationError(error_msg)
 
         try:
-            map_x_32: np.ndarray = map_x.astype(np.float32)
-            map_y_32: np.ndarray = map_y.astype(np.float32)
+            map_x_32: np.ndarray = map_x.astype(np.float32, copy=False)
+            map_y_32: np.ndarray = map_y.astype(np.float32, copy=False)
             logger.debug("map_x and map_y converted to float32 successfully.")
         except Exception as e:
             error_msg = f"Failed to convert map_x or map_y to float32: {e}"
@@ -88,6 +90,8 @@ class BaseInterpolation:
 
         if mask is not None:
             logger.debug("Applying mask to interpolated image.")
+            if isinstance(mask, PackedMask):
+                mask = mask.unpack()
             if not isinstance(mask, np.ndarray):
                 error_msg = "mask must be a NumPy ndarray if provided."
                 logger.error(error_msg)
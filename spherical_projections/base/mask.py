@@ -0,0 +1,45 @@
+# /Users/robinsongarcia/projects/gnomonic/projection/base/mask.py
+
+from typing import NamedTuple, Tuple
+import numpy as np
+import logging
+
+# Initialize logger for this module
+logger = logging.getLogger('gnomonic_projection.base.mask')
+
+class PackedMask(NamedTuple):
+    """
+    Boolean validity mask stored as a bitmap (one bit per point instead of one byte).
+
+    Attributes:
+        bits (np.ndarray): uint8 array packed along the last axis with `np.packbits`.
+        shape (Tuple[int, ...]): Shape of the original boolean mask.
+    """
+    bits: np.ndarray
+    shape: Tuple[int, ...]
+
+    @classmethod
+    def pack(cls, mask: np.ndarray) -> "PackedMask":
+        """
+        Pack a boolean mask into a bitmap.
+
+        Args:
+            mask (np.ndarray): Boolean mask to pack.
+
+        Returns:
+            PackedMask: The packed mask together with its original shape.
+        """
+        # np.packbits needs at least one axis; 0-d masks are packed as one element.
+        return cls(np.packbits(np.atleast_1d(mask), axis=-1), mask.shape)
+
+    def unpack(self) -> np.ndarray:
+        """
+        Expand the bitmap back into a boolean mask of the original shape.
+
+        Returns:
+            np.ndarray: The boolean mask.
+        """
+        logger.debug("Unpacking packed mask of shape %s.", self.shape)
+        if self.shape == ():
+            return np.unpackbits(self.bits, axis=-1, count=1).view(bool).reshape(())
+        return np.unpackbits(self.bits, axis=-1, count=self.shape[-1]).view(bool)
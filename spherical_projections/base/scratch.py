@@ -0,0 +1,51 @@
+# /Users/robinsongarcia/projects/gnomonic/projection/base/scratch.py
+
+from typing import Any, Dict, Tuple
+import numpy as np
+import logging
+
+# Initialize logger for this module
+logger = logging.getLogger('gnomonic_projection.base.scratch')
+
+class ScratchPool:
+    """
+    Pool of reusable NumPy buffers, one per name.
+
+    Projection loops that repeatedly project grids of the same shape can take their
+    output and intermediate arrays from a pool instead of allocating (and freeing)
+    full-size arrays on every call. Each name holds a single buffer, which is replaced
+    when it is requested with a different shape or dtype, so the pool never holds more
+    than one buffer per role. Buffers handed out by the pool are overwritten by the next
+    call that requests the same name, so callers must not hold on to them.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty ScratchPool.
+        """
+        self._buffers: Dict[str, np.ndarray] = {}
+
+    def get(self, name: str, shape: Tuple[int, ...], dtype: Any) -> np.ndarray:
+        """
+        Return the buffer registered under `name`, (re)allocating it if its shape or dtype differs.
+
+        Args:
+            name (str): Role of the buffer (e.g., 'x', 'cos_c').
+            shape (Tuple[int, ...]): Shape of the buffer.
+            dtype (Any): NumPy dtype of the buffer.
+
+        Returns:
+            np.ndarray: An uninitialized C-contiguous buffer.
+        """
+        shape, dtype = tuple(shape), np.dtype(dtype)
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            logger.debug("Allocating scratch buffer '%s' with shape %s and dtype %s.", name, shape, dtype)
+            buffer = self._buffers[name] = np.empty(shape, dtype=dtype)
+        return buffer
+
+    def clear(self) -> None:
+        """
+        Release all pooled buffers.
+        """
+        self._buffers.clear()
@@ -11,8 +11,13 @@ logger = logging.getLogger('gnomonic_projection.base.strategy')
 class BaseProjectionStrategy:
     """
     Base class for projection strategies.
+
+    Strategies whose projection methods accept `out=`/`scratch=` buffers set `scratch` to a
+    `ScratchPool`; the processor then reuses pooled buffers across calls.
     """
 
+    scratch = None
+
     @classmethod
     def from_spherical_to_projection(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
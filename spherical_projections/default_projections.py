@@ -1,17 +1,9 @@
 # /Users/robinsongarcia/projects/gnomonic/projection/default_projections.py
 
-from .registry import ProjectionRegistry
-
-from .gnomonic.config import GnomonicConfig
-from .gnomonic.grid import GnomonicGridGeneration
-from .gnomonic.strategy import GnomonicProjectionStrategy
-from .gnomonic.transform import GnomonicTransformer  # Updated to per-projection transformer
-
-from .mercator.config import MercatorConfig
-from .mercator.grid import MercatorGridGeneration
-from .mercator.strategy import MercatorProjectionStrategy
-from .mercator.transform import MercatorTransformer  # Updated to per-projection transformer
+import importlib
+from typing import Any, Callable, Dict, Tuple, Type
 
+from .registry import ProjectionRegistry
 from .base.interpolation import BaseInterpolation
 from .exceptions import RegistrationError
 import logging
@@ -19,36 +11,53 @@ import logging
 # Initialize logger for this module
 logger = logging.getLogger('gnomonic_projection.default_projections')
 
+# Order of the component class names in each `_PROJECTION_SPECS` row.
+_COMPONENT_KEYS = ("config", "grid_generation", "projection_strategy", "transformer")
+
+# (name, subpackage, config, grid generation, projection strategy, transformer) rows. Subpackages
+# are only imported when their projection is first requested from the registry, so using one
+# projection does not pay the import cost of all the others.
+_PROJECTION_SPECS = (
+    ("gnomonic", ".gnomonic",
+     "GnomonicConfig", "GnomonicGridGeneration", "GnomonicProjectionStrategy", "GnomonicTransformer"),
+    ("mercator", ".mercator",
+     "MercatorConfig", "MercatorGridGeneration", "MercatorProjectionStrategy", "MercatorTransformer"),
+)
+
+def _lazy_components(module_name: str, class_names: Tuple[str, ...]) -> Callable[[], Dict[str, Type[Any]]]:
+    """
+    Build a loader that imports a projection subpackage and returns its components.
+
+    Args:
+        module_name (str): Relative name of the projection subpackage (e.g., '.gnomonic').
+        class_names (Tuple[str, ...]): Class names within the subpackage, ordered as `_COMPONENT_KEYS`.
+
+    Returns:
+        Callable[[], Dict[str, Type[Any]]]: Loader suitable for `ProjectionRegistry.register`.
+    """
+    def load() -> Dict[str, Type[Any]]:
+        logger.debug(f"Importing '{module_name}' for lazily registered projection.")
+        module = importlib.import_module(module_name, package=__package__)
+        components = {key: getattr(module, class_name) for key, class_name in zip(_COMPONENT_KEYS, class_names)}
+        components["interpolation"] = BaseInterpolation
+        return components
+    return load
+
 def register_default_projections():
     """
     Register default projections with their components.
 
+    The components are registered lazily: each projection's subpackage is imported the
+    first time that projection is requested.
+
     Raises:
         RegistrationError: If registration of any default projection fails.
     """
     logger.debug("Registering default projections.")
     try:
-        # Register Gnomonic projection
-        ProjectionRegistry.register("gnomonic", {
-            "config": GnomonicConfig,
-            "grid_generation": GnomonicGridGeneration,
-            "projection_strategy": GnomonicProjectionStrategy,
-            "interpolation": BaseInterpolation,
-            "transformer": GnomonicTransformer,  # Updated to GnomonicTransformer
-        })
-        logger.info("Default projection 'gnomonic' registered successfully.")
-
-        # Register Mercator projection
-        ProjectionRegistry.register("mercator", {
-            "config": MercatorConfig,
-            "grid_generation": MercatorGridGeneration,
-            "projection_strategy": MercatorProjectionStrategy,
-            "interpolation": BaseInterpolation,
-            "transformer": MercatorTransformer,  # Updated to MercatorTransformer
-        })
-
-
-        logger.info("Default projection 'mercator' registered successfully.")
+        for name, module_name, *class_names in _PROJECTION_SPECS:
+            ProjectionRegistry.register(name, _lazy_components(module_name, tuple(class_names)))
+            logger.info(f"Default projection '{name}' registered successfully.")
 
     except RegistrationError as e:
         logger.exception("Failed to register default projections.")
@@ -57,4 +66,4 @@ def register_default_projections():
         logger.exception("An unexpected error occurred while registering default projections.")
         raise RegistrationError(f"An unexpected error occurred: {e}") from e
 
-    logger.debug("All default projections registered.")
\ No newline at end of file
+    logger.debug("All default projections registered.")
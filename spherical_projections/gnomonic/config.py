@@ -1,9 +1,12 @@
 # /Users/robinsongarcia/projects/gnomonic/projection/gnomonic/config.py
 
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
 from pydantic import BaseModel, Field, validator
 import cv2
 import logging
+import math
+import numpy as np
 from ..exceptions import ConfigurationError
 
 # Initialize logger for this module
@@ -32,6 +35,12 @@ class GnomonicConfigModel(BaseModel):
     interpolation: Optional[int] = Field(default=cv2.INTER_LINEAR, description="Interpolation method for OpenCV remap.")
     borderMode: Optional[int] = Field(default=cv2.BORDER_CONSTANT, description="Border mode for OpenCV remap.")
     borderValue: Optional[Any] = Field(default=0, description="Border value for OpenCV remap.")
+    pack_mask: bool = Field(default=False, description="Return the forward-projection validity mask as a packed bitmap.")
+    dtype: Any = Field(default=np.float32, description="Floating-point dtype of the projection grids and outputs.")
+    use_fast_trig: bool = Field(
+        default=False,
+        description="Use a polynomial arcsin (|error| <= 2e-8 rad) in the inverse projection; requires Numba."
+    )
 
     @validator('fov_deg')
     def validate_fov(cls, v):
@@ -42,8 +51,45 @@ class GnomonicConfigModel(BaseModel):
             raise ValueError("Field of view (fov_deg) must be between 0 and 180 degrees.")
         return v
 
+    @validator('dtype', always=True)
+    def validate_dtype(cls, v):
+        """
+        Validate that dtype is float32 or float64 and normalize it to a NumPy dtype.
+
+        These are the only dtypes the compiled and Numba forward kernels are built for.
+        """
+        dtype = np.dtype(v)
+        if dtype not in (np.dtype(np.float32), np.dtype(np.float64)):
+            raise ValueError(f"dtype must be float32 or float64, got {dtype}.")
+        return dtype
+
     class Config:
         arbitrary_types_allowed = True
+        validate_assignment = True
+
+class GnomonicTrig(NamedTuple):
+    """
+    Projection-center constants shared by the forward and inverse Gnomonic equations.
+
+    Attributes:
+        phi1 (float): Latitude of the projection center in radians.
+        lam0 (float): Longitude of the projection center in radians.
+        sp (float): sin(phi1).
+        cp (float): cos(phi1).
+    """
+    phi1: float
+    lam0: float
+    sp: float
+    cp: float
+
+@lru_cache(maxsize=128)
+def _center_trig(phi1_deg: float, lam0_deg: float) -> GnomonicTrig:
+    """
+    Compute (and memoize) the trigonometric constants for a projection center.
+    """
+    phi1 = math.radians(phi1_deg)
+    lam0 = math.radians(lam0_deg)
+    return GnomonicTrig(phi1, lam0, math.sin(phi1), math.cos(phi1))
 
 class GnomonicConfig:
     """
@@ -85,7 +131,8 @@ class GnomonicConfig:
         """
         logger.debug(f"Updating GnomonicConfig with parameters: {kwargs}")
         try:
-            updated_config = self.config.copy(update=kwargs)
+            # Rebuilt rather than copy(update=...) so the new values go through the validators.
+            updated_config = type(self.config)(**{**self.config.dict(), **kwargs})
             self.config = updated_config
             logger.info("GnomonicConfig updated successfully.")
         except Exception as e:
@@ -93,6 +140,20 @@ class GnomonicConfig:
             logger.exception(error_msg)
             raise ConfigurationError(error_msg) from e
 
+    @property
+    def _trig(self) -> GnomonicTrig:
+        """
+        Trigonometric constants of the current projection center.
+
+        The values are memoized by (phi1_deg, lam0_deg), so repeated projections with the
+        same center reuse them while any update of the center (through `update` or by
+        assigning the underlying model fields) is picked up on the next access.
+
+        Returns:
+            GnomonicTrig: phi1/lam0 in radians and sin/cos of phi1 as Python floats.
+        """
+        return _center_trig(float(self.config.phi1_deg), float(self.config.lam0_deg))
+
     def __getattr__(self, item: str) -> Any:
         """
         Access configuration parameters as attributes.
@@ -106,7 +167,7 @@ class GnomonicConfig:
         Raises:
             AttributeError: If the parameter does not exist.
         """
-        logger.debug(f"Accessing GnomonicConfig attribute '{item}'.")
+        logger.debug("Accessing GnomonicConfig attribute '%s'.", item)
         try:
             return getattr(self.config, item)
         except AttributeError:
@@ -0,0 +1,167 @@
+# /Users/robinsongarcia/projects/gnomonic/projection/gnomonic/gpu.py
+
+"""
+Device (GPU) backends for the Gnomonic projection equations.
+
+Arrays that already live on a device are projected where they are instead of being
+copied back to the host: CuPy arrays go through fused `cupy.ElementwiseKernel`s
+(one kernel launch per direction) and Torch tensors on a non-CPU device (e.g. CUDA)
+through `torch.compile`d functions. CPU Torch tensors are not routed here: the
+strategies convert them with `np.asarray` and project them with the NumPy-side
+kernels, returning NumPy arrays. Neither library is imported by this module until an
+array of that type is actually passed in, so NumPy-only users pay nothing for this
+support.
+"""
+
+from functools import lru_cache
+from typing import Any, Tuple
+import logging
+
+logger = logging.getLogger('gnomonic_projection.gnomonic.gpu')
+
+_CUPY_FORWARD_SRC = """
+    const double deg2rad = 0.017453292519943295;
+    double sp, cp, sl, cl;
+    sincos(lat * deg2rad, &sp, &cp);
+    sincos(lon * deg2rad - lam0, &sl, &cl);
+    double cos_c = sphi1 * sp + cphi1 * cp * cl;
+    mask = cos_c > 0;
+    cos_c = copysign(fmax(fabs(cos_c), 1e-10), cos_c);
+    x = R * cp * sl / cos_c;
+    y = R * (cphi1 * sp - sphi1 * cp * cl) / cos_c;
+"""
+
+_CUPY_INVERSE_SRC = """
+    const double rad2deg = 57.29577951308232;
+    double inv_h = rsqrt((double)x * x + (double)y * y + R * R);
+    lat = asin((R * sphi1 - y * cphi1) * inv_h) * rad2deg;
+    lon = (lam0 + atan2((double)x, R * cphi1 + y * sphi1)) * rad2deg;
+"""
+
+
+def array_backend(array: Any) -> str:
+    """
+    Name of the array library that owns `array` ("numpy", "cupy", "torch", ...).
+
+    The check is done on the type's module so that CuPy/Torch are never imported here.
+    """
+    return type(array).__module__.split(".", 1)[0]
+
+
+def is_device_array(array: Any) -> bool:
+    """
+    Whether `array` is handled by this module: a CuPy array, or a Torch tensor not on the CPU.
+    """
+    backend = array_backend(array)
+    if backend == "cupy":
+        return True
+    if backend == "torch":
+        return array.device.type != "cpu"
+    return False
+
+
+@lru_cache(maxsize=None)
+def _cupy_kernels() -> Tuple[Any, Any]:
+    """
+    Build the fused CuPy forward/inverse kernels (compiled by CuPy on first launch).
+    """
+    import cupy
+
+    logger.debug("Building CuPy Gnomonic kernels.")
+    forward = cupy.ElementwiseKernel(
+        "T lat, T lon, float64 sphi1, float64 cphi1, float64 lam0, float64 R",
+        "T x, T y, bool mask",
+        _CUPY_FORWARD_SRC,
+        "gnomonic_forward_kernel",
+    )
+    inverse = cupy.ElementwiseKernel(
+        "T x, T y, float64 sphi1, float64 cphi1, float64 lam0, float64 R",
+        "T lat, T lon",
+        _CUPY_INVERSE_SRC,
+        "gnomonic_inverse_kernel",
+    )
+    return forward, inverse
+
+
+def _torch_forward(lat, lon, sphi1: float, cphi1: float, lam0: float, R: float):
+    """
+    Torch implementation of the forward Gnomonic projection.
+    """
+    import torch
+
+    phi = torch.deg2rad(lat)
+    dlam = torch.deg2rad(lon) - lam0
+    sp, cp = torch.sin(phi), torch.cos(phi)
+    sl, cl = torch.sin(dlam), torch.cos(dlam)
+    cos_c = sphi1 * sp + cphi1 * cp * cl
+    mask = cos_c > 0
+    cos_c = torch.copysign(cos_c.abs().clamp_min(1e-10), cos_c)
+    x = R * cp * sl / cos_c
+    y = R * (cphi1 * sp - sphi1 * cp * cl) / cos_c
+    return x, y, mask
+
+
+def _torch_inverse(x, y, sphi1: float, cphi1: float, lam0: float, R: float):
+    """
+    Torch implementation of the inverse Gnomonic projection.
+    """
+    import torch
+
+    inv_h = torch.rsqrt(x * x + y * y + R * R)
+    lat = torch.rad2deg(torch.asin((R * sphi1 - y * cphi1) * inv_h))
+    lon = torch.rad2deg(lam0 + torch.atan2(x, R * cphi1 + y * sphi1))
+    return lat, lon
+
+
+@lru_cache(maxsize=None)
+def _torch_kernels() -> Tuple[Any, Any]:
+    """
+    Wrap the Torch implementations with `torch.compile` when it is available (Torch >= 2.0).
+    """
+    import torch
+
+    compile_fn = getattr(torch, "compile", None)
+    if compile_fn is None:
+        logger.debug("torch.compile unavailable; using eager Torch Gnomonic functions.")
+        return _torch_forward, _torch_inverse
+    return compile_fn(_torch_forward), compile_fn(_torch_inverse)
+
+
+def forward(lat: Any, lon: Any, trig: Any, R: float) -> Tuple[Any, Any, Any]:
+    """
+    Forward Gnomonic projection of device-resident latitude/longitude arrays (degrees).
+
+    Args:
+        lat (Any): CuPy array or Torch tensor of latitudes.
+        lon (Any): CuPy array or Torch tensor of longitudes.
+        trig (GnomonicTrig): Projection-center constants.
+        R (float): Sphere radius.
+
+    Returns:
+        Tuple[Any, Any, Any]: X, Y and validity mask on the same device as the inputs.
+    """
+    if array_backend(lat) == "cupy":
+        kernel, _ = _cupy_kernels()
+        return kernel(lat, lon, trig.sp, trig.cp, trig.lam0, R)
+    kernel, _ = _torch_kernels()
+    return kernel(lat, lon, trig.sp, trig.cp, trig.lam0, R)
+
+
+def inverse(x: Any, y: Any, trig: Any, R: float) -> Tuple[Any, Any]:
+    """
+    Inverse Gnomonic projection of device-resident planar coordinates.
+
+    Args:
+        x (Any): CuPy array or Torch tensor of planar X-coordinates.
+        y (Any): CuPy array or Torch tensor of planar Y-coordinates.
+        trig (GnomonicTrig): Projection-center constants.
+        R (float): Sphere radius.
+
+    Returns:
+        Tuple[Any, Any]: Latitude and longitude in degrees on the same device as the inputs.
+    """
+    if array_backend(x) == "cupy":
+        _, kernel = _cupy_kernels()
+        return kernel(x, y, trig.sp, trig.cp, trig.lam0, R)
+    _, kernel = _torch_kernels()
+    return kernel(x, y, trig.sp, trig.cp, trig.lam0, R)
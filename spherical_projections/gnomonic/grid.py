@@ -4,6 +4,7 @@ from typing import Any, Tuple
 from ..base.grid import BaseGridGeneration
 from .config import GnomonicConfig
 from ..exceptions import GridGenerationError
+import math
 import numpy as np
 import logging
 
@@ -22,11 +23,10 @@ class GnomonicGridGeneration(BaseGridGeneration):
             Tuple[np.ndarray, np.ndarray]: The X and Y coordinate grids for forward projection.
         """
         logger.debug("Generating Gnomonic projection grid.")
-        half_fov_rad = np.deg2rad(self.config.fov_deg / 2)
-        x_max = np.tan(half_fov_rad) * self.config.R
-        y_max = np.tan(half_fov_rad) * self.config.R
-        x_vals = np.linspace(-x_max, x_max, self.config.x_points)
-        y_vals = np.linspace(-y_max, y_max, self.config.y_points)
+        dtype = np.dtype(self.config.dtype)
+        x_max = y_max = math.tan(math.radians(self.config.fov_deg / 2)) * self.config.R
+        x_vals = np.linspace(-x_max, x_max, self.config.x_points, dtype=dtype)
+        y_vals = np.linspace(-y_max, y_max, self.config.y_points, dtype=dtype)
         grid_x, grid_y = np.meshgrid(x_vals, y_vals)
         return grid_x, grid_y
 
@@ -38,7 +38,8 @@ class GnomonicGridGeneration(BaseGridGeneration):
             Tuple[np.ndarray, np.ndarray]: The longitude and latitude grids.
         """
         logger.debug("Generating Gnomonic spherical grid.")
-        lon_vals = np.linspace(self.config.lon_min, self.config.lon_max, self.config.lon_points) + delta_lon
-        lat_vals = np.linspace(self.config.lat_min, self.config.lat_max, self.config.lat_points) + delta_lat
+        dtype = np.dtype(self.config.dtype)
+        lon_vals = np.linspace(self.config.lon_min, self.config.lon_max, self.config.lon_points, dtype=dtype) + dtype.type(delta_lon)
+        lat_vals = np.linspace(self.config.lat_min, self.config.lat_max, self.config.lat_points, dtype=dtype) + dtype.type(delta_lat)
         grid_lon, grid_lat = np.meshgrid(lon_vals, lat_vals)
         return grid_lon, grid_lat
\ No newline at end of file
@@ -1,6 +1,7 @@
 # /Users/robinsongarcia/projects/gnomonic/projection/gnomonic/transform.py
 
 from typing import Tuple, Any
+import math
 import numpy as np
 import logging
 from ..exceptions import TransformationError, ConfigurationError
@@ -125,9 +126,7 @@ class GnomonicTransformer(BaseCoordinateTransformer):
             Tuple[np.ndarray, np.ndarray]: Image coordinates map_x, map_y.
         """
         logger.debug("Mapping Gnomonic planar coordinates to image coordinates.")
-        half_fov_rad = np.deg2rad(config.fov_deg / 2)
-        x_max = np.tan(half_fov_rad) * config.R
-        y_max = np.tan(half_fov_rad) * config.R
+        x_max = y_max = math.tan(math.radians(config.fov_deg / 2)) * config.R
         x_min, y_min = -x_max, -y_max
 
         map_x = self._compute_image_coords(x, x_min, x_max, config.x_points)
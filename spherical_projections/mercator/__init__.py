@@ -3,9 +3,11 @@
 from .config import MercatorConfig
 from .grid import MercatorGridGeneration
 from .strategy import MercatorProjectionStrategy
+from .transform import MercatorTransformer
 
 __all__ = [
     "MercatorConfig",
     "MercatorGridGeneration",
     "MercatorProjectionStrategy",
+    "MercatorTransformer",
 ]
\ No newline at end of file
@@ -7,6 +7,7 @@ import logging
 import cv2
 import numpy as np
 from .utils import PreprocessEquirectangularImage
+from .base.mask import PackedMask
 # Initialize logger for this module
 logger = logging.getLogger('gnomonic_projection.processor')
 
@@ -77,7 +78,13 @@ class ProjectionProcessor:
             x_grid, y_grid = self.grid_generation.projection_grid()
             logger.debug("Forward grid generated successfully.")
 
-            lat, lon = self.projection.from_projection_to_spherical(x_grid, y_grid)
+            scratch = self.projection.scratch
+            if scratch is not None:
+                dtype = np.result_type(x_grid, y_grid)
+                out = (scratch.get("lat", x_grid.shape, dtype), scratch.get("lon", x_grid.shape, dtype))
+                lat, lon = self.projection.from_projection_to_spherical(x_grid, y_grid, out=out)
+            else:
+                lat, lon = self.projection.from_projection_to_spherical(x_grid, y_grid)
             logger.debug("Forward projection computed successfully.")
 
             map_x, map_y = self.transformer.spherical_to_image_coords(lat, lon, img.shape[:2])
@@ -125,12 +132,21 @@ class ProjectionProcessor:
             lon_grid, lat_grid = self.grid_generation.spherical_grid()
             logger.debug("Backward grid generated successfully.")
 
-            x, y, mask = self.projection.from_spherical_to_projection(lat_grid, lon_grid)
+            scratch = self.projection.scratch
+            if scratch is not None:
+                shape, dtype = lat_grid.shape, np.result_type(lat_grid, lon_grid)
+                out = (scratch.get("x", shape, dtype), scratch.get("y", shape, dtype), scratch.get("mask", shape, bool))
+                x, y, mask = self.projection.from_spherical_to_projection(lat_grid, lon_grid, out=out, scratch=scratch)
+            else:
+                x, y, mask = self.projection.from_spherical_to_projection(lat_grid, lon_grid)
             logger.debug("Backward projection computed successfully.")
 
             map_x, map_y = self.transformer.projection_to_image_coords(x, y, self.config.config_object)
             logger.debug("Grid coordinates transformed to image space successfully.")
 
+            # Unpacked once here and shared by the interpolation and the returned mask.
+            if isinstance(mask, PackedMask):
+                mask = mask.unpack()
             back_projected_img = self.interpolation.interpolate(
                 rect_img, map_x, map_y, mask if kwargs.get("return_mask", True) else None
             )
@@ -1,6 +1,6 @@
 # /Users/robinsongarcia/projects/gnomonic/projection/registry.py
 
-from typing import Any, Dict, Optional, Type, Union
+from typing import Any, Callable, Dict, Optional, Type, Union
 from .base.config import BaseProjectionConfig
 from .processor import ProjectionProcessor
 from .exceptions import RegistrationError
@@ -13,25 +13,38 @@ class ProjectionRegistry:
     """
     Registry for managing projection configurations and their components.
     """
-    _registry: Dict[str, Dict[str, Type[Any]]] = {}
+    _registry: Dict[str, Union[Dict[str, Type[Any]], Callable[[], Dict[str, Type[Any]]]]] = {}
 
     @classmethod
-    def register(cls, name: str, components: Dict[str, Type[Any]]) -> None:
+    def register(
+        cls,
+        name: str,
+        components: Union[Dict[str, Type[Any]], Callable[[], Dict[str, Type[Any]]]]
+    ) -> None:
         """
         Register a projection with its required components.
 
         Args:
             name (str): Name of the projection (e.g., 'gnomonic').
-            components (Dict[str, Type[Any]]): A dictionary containing:
+            components (Union[Dict[str, Type[Any]], Callable[[], Dict[str, Type[Any]]]]):
+                A dictionary containing:
                 - 'config': Configuration class
                 - 'grid_generation': Grid generation class
                 - 'projection_strategy': Projection strategy class
                 - 'interpolation' (optional): Interpolation class
                 - 'transformer': Transformation class (optional)
+                or a zero-argument callable returning such a dictionary. A callable is
+                only invoked (and its result validated) when the projection is first
+                retrieved, which lets projections defer importing their modules.
 
         Raises:
             RegistrationError: If required components are missing or invalid.
         """
+        if callable(components):
+            cls._registry[name] = components
+            logger.info(f"Projection '{name}' registered lazily.")
+            return
+
         logger.debug(f"Attempting to register projection '{name}' with components: {list(components.keys())}")
         required_keys = {"config", "grid_generation", "projection_strategy"}
         missing_keys = required_keys - components.keys()
@@ -78,7 +91,7 @@ class ProjectionRegistry:
             logger.error(error_msg)
             raise RegistrationError(error_msg)
 
-        components = cls._registry[name]
+        components = cls._resolve(name)
         try:
             ConfigClass = components["config"]
             GridGenerationClass = components["grid_generation"]
@@ -116,6 +129,34 @@ class ProjectionRegistry:
         logger.debug(f"Returning BaseProjectionConfig for projection '{name}'.")
         return base_config
 
+    @classmethod
+    def _resolve(cls, name: str) -> Dict[str, Type[Any]]:
+        """
+        Return the components of a registered projection, loading them if registered lazily.
+
+        Args:
+            name (str): Name of a registered projection.
+
+        Returns:
+            Dict[str, Type[Any]]: The validated component dictionary.
+
+        Raises:
+            RegistrationError: If loading or validating the lazy components fails.
+        """
+        components = cls._registry[name]
+        if not callable(components):
+            return components
+
+        logger.debug(f"Loading lazily registered components for projection '{name}'.")
+        try:
+            loaded = components()
+        except Exception as e:
+            error_msg = f"Failed to load components for projection '{name}': {e}"
+            logger.exception(error_msg)
+            raise RegistrationError(error_msg) from e
+        cls.register(name, loaded)
+        return cls._registry[name]
+
     @classmethod
     def list_projections(cls) -> list:
         """
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from spherical_projections.exceptions import ConfigurationError
+from spherical_projections.gnomonic.config import GnomonicConfig
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, "float32", "float64"])
+def test_supported_dtypes_are_normalized(dtype):
+    assert GnomonicConfig(dtype=dtype).dtype == np.dtype(dtype)
+
+
+@pytest.mark.parametrize("dtype", [np.float16, np.longdouble, np.int32, np.complex64])
+def test_unsupported_dtypes_are_rejected(dtype):
+    with pytest.raises(ConfigurationError):
+        GnomonicConfig(dtype=dtype)
+
+
+def test_update_validates_dtype():
+    config = GnomonicConfig()
+    with pytest.raises(ConfigurationError):
+        config.update(dtype=np.float16)
+    assert config.dtype == np.float32
+    config.update(dtype=np.float64)
+    assert config.dtype == np.float64
+
+
+def test_assignment_validates_dtype():
+    config = GnomonicConfig()
+    with pytest.raises(ValueError):
+        config.config.dtype = np.float16
@@ -0,0 +1,248 @@
+import numpy as np
+import pytest
+
+from spherical_projections.exceptions import ProcessingError
+from spherical_projections.gnomonic import strategy
+from spherical_projections.gnomonic.config import GnomonicConfig
+from spherical_projections.gnomonic.strategy import GnomonicProjectionStrategy
+
+
+def make_strategy(**kwargs):
+    params = {"phi1_deg": 25.0, "lam0_deg": 10.0}
+    params.update(kwargs)
+    return GnomonicProjectionStrategy(GnomonicConfig(**params))
+
+
+def planar_grid(dtype=np.float32, shape=(32, 48)):
+    x, y = np.meshgrid(np.linspace(-1.0, 1.0, shape[1]), np.linspace(-0.8, 0.8, shape[0]))
+    return x.astype(dtype), y.astype(dtype)
+
+
+def spherical_grid(dtype=np.float32, shape=(32, 48)):
+    lon, lat = np.meshgrid(np.linspace(-60.0, 80.0, shape[1]), np.linspace(-40.0, 70.0, shape[0]))
+    return lat.astype(dtype), lon.astype(dtype)
+
+
+@pytest.fixture(params=["numexpr", "numpy"])
+def inverse_backend(request, monkeypatch):
+    if request.param == "numexpr" and strategy.ne is None:
+        pytest.skip("numexpr is not installed")
+    if request.param == "numpy":
+        monkeypatch.setattr(strategy, "ne", None)
+    return request.param
+
+
+def test_inverse_out_returns_given_buffers(inverse_backend):
+    proj = make_strategy()
+    x, y = planar_grid()
+    expected = [a.copy() for a in proj.from_projection_to_spherical(x, y)]
+    out = (np.empty_like(x), np.empty_like(x))
+    lat, lon = proj.from_projection_to_spherical(x, y, out=out)
+    assert lat is out[0] and lon is out[1]
+    np.testing.assert_array_equal(lat, expected[0])
+    np.testing.assert_array_equal(lon, expected[1])
+
+
+def test_forward_out_returns_given_buffers():
+    proj = make_strategy()
+    lat, lon = spherical_grid()
+    expected = [a.copy() for a in proj.from_spherical_to_projection(lat, lon)]
+    out = (np.empty_like(lat), np.empty_like(lat), np.empty(lat.shape, dtype=bool))
+    result = proj.from_spherical_to_projection(lat, lon, out=out, scratch=proj.scratch)
+    assert all(r is o for r, o in zip(result, out))
+    for r, e in zip(result, expected):
+        np.testing.assert_array_equal(r, e)
+
+
+def test_inverse_out_aliasing_inputs_is_rejected(inverse_backend):
+    proj = make_strategy()
+    x, y = planar_grid()
+    with pytest.raises(ProcessingError, match="share memory"):
+        proj.from_projection_to_spherical(x, y, out=(x, y))
+    with pytest.raises(ProcessingError, match="share memory"):
+        proj.from_projection_to_spherical(x, y, out=(np.empty_like(x), x))
+
+
+def test_forward_out_aliasing_is_rejected():
+    proj = make_strategy()
+    lat, lon = spherical_grid()
+    mask = np.empty(lat.shape, dtype=bool)
+    with pytest.raises(ProcessingError, match="share memory"):
+        proj.from_spherical_to_projection(lat, lon, out=(lat, np.empty_like(lat), mask))
+    with pytest.raises(ProcessingError, match="share memory"):
+        x = np.empty_like(lat)
+        proj.from_spherical_to_projection(lat, lon, out=(x, x, mask))
+
+
+def test_out_with_wrong_shape_is_rejected():
+    proj = make_strategy()
+    x, y = planar_grid()
+    with pytest.raises(ProcessingError, match="C-contiguous"):
+        proj.from_projection_to_spherical(x, y, out=(np.empty(3, np.float32), np.empty(3, np.float32)))
+
+
+def forward_kernels():
+    kernels = [strategy._gnomonic_forward_numpy]
+    if strategy.njit is not None:
+        kernels.append(strategy._gnomonic_forward_numba)
+    if strategy._gnomonic_fast is not None:
+        kernels.append(strategy._gnomonic_forward_c)
+    return kernels
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("phi1_deg", [0.0, 35.0])
+def test_forward_kernels_agree(dtype, phi1_deg):
+    lat, lon = (a.ravel() for a in spherical_grid(dtype, shape=(64, 96)))
+    phi1, lam0 = np.deg2rad(phi1_deg), np.deg2rad(10.0)
+    results = []
+    for kernel in forward_kernels():
+        x, y, mask = np.empty_like(lat), np.empty_like(lat), np.empty(lat.shape, dtype=bool)
+        kernel(lat, lon, phi1, lam0, 1.0, x, y, mask)
+        results.append((x, y, mask))
+    tol = 1e-4 if dtype == np.float32 else 1e-10
+    x0, y0, mask0 = results[0]
+    # Near the horizon cos_c is tiny and float32 results are ill-conditioned; compare the
+    # points within ~84 degrees of the center.
+    close = mask0 & (np.hypot(x0, y0) < 10)
+    for x, y, mask in results[1:]:
+        np.testing.assert_array_equal(mask, mask0)
+        np.testing.assert_allclose(x[close], x0[close], rtol=tol, atol=tol)
+        np.testing.assert_allclose(y[close], y0[close], rtol=tol, atol=tol)
+
+
+@pytest.mark.parametrize("per_center", [True, False])
+def test_batched_forward_matches_per_center_loop(per_center, monkeypatch):
+    monkeypatch.setitem(strategy._BATCHED_PER_CENTER, np.dtype(np.float64), per_center)
+    proj = make_strategy(dtype=np.float64)
+    lat, lon = spherical_grid(np.float64)
+    phi1s, lam0s = np.array([0.0, 20.0, -35.0]), np.array([10.0, -40.0, 120.0])
+
+    x, y, mask = proj.from_spherical_to_projection_batched(lat, lon, phi1s, lam0s)
+    assert x.shape == y.shape == mask.shape == (3,) + lat.shape
+    for b, (phi1, lam0) in enumerate(zip(phi1s, lam0s)):
+        proj.config.update(phi1_deg=phi1, lam0_deg=lam0)
+        xb, yb, mb = proj.from_spherical_to_projection(lat, lon)
+        np.testing.assert_array_equal(mask[b], mb)
+        np.testing.assert_allclose(x[b][mb], xb[mb], rtol=1e-9, atol=1e-9)
+        np.testing.assert_allclose(y[b][mb], yb[mb], rtol=1e-9, atol=1e-9)
+
+
+def test_batched_forward_packs_mask():
+    proj = make_strategy(pack_mask=True)
+    lat, lon = spherical_grid()
+    _, _, packed = proj.from_spherical_to_projection_batched(lat, lon, [0.0, 30.0], [0.0, 30.0])
+    assert packed.unpack().shape == (2,) + lat.shape
+
+
+def test_batched_forward_rejects_mismatched_centers():
+    proj = make_strategy()
+    lat, lon = spherical_grid()
+    with pytest.raises(ProcessingError):
+        proj.from_spherical_to_projection_batched(lat, lon, [0.0, 1.0], [0.0])
+
+
+@pytest.mark.skipif(strategy.njit is None, reason="use_fast_trig requires Numba")
+def test_fast_arcsin_error_bound():
+    a = np.linspace(-1.0, 1.0, 200001)
+    error = np.abs(np.array([strategy._fast_arcsin(v) for v in a[::97]]) - np.arcsin(a[::97]))
+    assert error.max() <= 2.5e-8
+
+
+@pytest.mark.skipif(strategy.njit is None, reason="use_fast_trig requires Numba")
+@pytest.mark.parametrize("phi1_deg", [0.0, 45.0, 89.0])
+def test_fast_trig_inverse_error_bound(phi1_deg):
+    x, y = planar_grid(np.float64, shape=(128, 128))
+    exact = make_strategy(phi1_deg=phi1_deg, dtype=np.float64)
+    fast = make_strategy(phi1_deg=phi1_deg, dtype=np.float64, use_fast_trig=True)
+    lat, lon = exact.from_projection_to_spherical(x, y)
+    lat_fast, lon_fast = fast.from_projection_to_spherical(x, y)
+    assert np.deg2rad(np.abs(lat_fast - lat)).max() <= 2.5e-8
+    np.testing.assert_allclose(lon_fast, lon, atol=1e-10)
+
+
+@pytest.mark.parametrize("use_fast_trig", [False, True])
+def test_projection_center_is_finite(inverse_backend, use_fast_trig):
+    proj = make_strategy(use_fast_trig=use_fast_trig)
+    lat, lon = proj.from_projection_to_spherical(np.zeros((2, 2)), np.zeros((2, 2)))
+    assert np.all(np.isfinite(lat)) and np.all(np.isfinite(lon))
+    np.testing.assert_allclose(lat, 25.0, atol=1e-5)
+    np.testing.assert_allclose(lon, 10.0, atol=1e-5)
+
+
+def test_scalar_inputs_give_0d_outputs(inverse_backend):
+    proj = make_strategy()
+    x, y, mask = proj.from_spherical_to_projection(30.0, 15.0)
+    assert np.ndim(x) == np.ndim(y) == np.ndim(mask) == 0
+    lat, lon = proj.from_projection_to_spherical(x, y)
+    assert np.ndim(lat) == np.ndim(lon) == 0
+    expected = proj.from_spherical_to_projection(np.array([30.0]), np.array([15.0]))
+    np.testing.assert_array_equal(x, expected[0][0])
+    np.testing.assert_array_equal(mask, expected[2][0])
+
+
+def test_non_contiguous_inputs_keep_their_shape():
+    proj = make_strategy()
+    lat, lon = spherical_grid()
+    x, y, mask = proj.from_spherical_to_projection(lat.T, lon.T)
+    assert x.shape == lat.T.shape
+    expected = proj.from_spherical_to_projection(lat, lon)
+    np.testing.assert_array_equal(x, expected[0].T)
+
+
+def test_forward_rejects_mismatched_shapes():
+    proj = make_strategy()
+    with pytest.raises(ProcessingError):
+        proj.from_spherical_to_projection(np.zeros(1000), np.zeros(3))
+    with pytest.raises(ProcessingError):
+        proj.from_spherical_to_projection_batched(np.zeros(1000), np.zeros(3), [0.0], [0.0])
+
+
+def test_forward_broadcasts_inputs():
+    proj = make_strategy()
+    lat = np.linspace(-40.0, 40.0, 5)[:, None]
+    lon = np.linspace(-30.0, 30.0, 4)[None, :]
+    x, y, mask = proj.from_spherical_to_projection(lat, lon)
+    assert x.shape == y.shape == mask.shape == (5, 4)
+    expected = proj.from_spherical_to_projection(*np.broadcast_arrays(lat, lon))
+    for result, e in zip((x, y, mask), expected):
+        np.testing.assert_array_equal(result, e)
+    bx, _, _ = proj.from_spherical_to_projection_batched(lat, lon, [25.0], [10.0])
+    assert bx.shape == (1, 5, 4)
+
+
+def test_compiled_kernel_rejects_mismatched_lengths():
+    if strategy._gnomonic_fast is None:
+        pytest.skip("compiled kernel is not built")
+    lat, short = np.zeros(10), np.zeros(3)
+    with pytest.raises(ValueError):
+        strategy._gnomonic_forward_c(lat, short, 0.0, 0.0, 1.0, np.empty(10), np.empty(10), np.empty(10, bool))
+
+
+@pytest.mark.parametrize("use_fast_trig", [False, True])
+def test_inverse_broadcasts_inputs(inverse_backend, use_fast_trig):
+    if use_fast_trig and strategy.njit is None:
+        pytest.skip("use_fast_trig requires Numba")
+    proj = make_strategy(use_fast_trig=use_fast_trig)
+    x = np.linspace(-1.0, 1.0, 5)[:, None]
+    y = np.linspace(-0.5, 0.5, 4)[None, :]
+    lat, lon = proj.from_projection_to_spherical(x, y)
+    assert lat.shape == lon.shape == (5, 4)
+    expected = proj.from_projection_to_spherical(*np.broadcast_arrays(x, y))
+    np.testing.assert_array_equal(lat, expected[0])
+    np.testing.assert_array_equal(lon, expected[1])
+    with pytest.raises(ProcessingError):
+        proj.from_projection_to_spherical(np.zeros(5), np.zeros(3))
+
+
+def test_forward_kernels_are_selected_per_dtype():
+    kernels = strategy._FORWARD_KERNELS
+    if strategy._gnomonic_fast is None:
+        assert kernels[np.dtype(np.float32)] is strategy._gnomonic_forward_numpy
+        return
+    assert strategy._gnomonic_fast.SIMD_BITS in (0, 256, 512)
+    assert kernels[np.dtype(np.float32)] is strategy._gnomonic_forward_c
+    if strategy._gnomonic_fast.VECTORIZED:
+        assert kernels[np.dtype(np.float64)] is strategy._gnomonic_forward_c
+    elif strategy.njit is not None:
+        assert kernels[np.dtype(np.float64)] is strategy._gnomonic_forward_numba
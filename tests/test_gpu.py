@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from spherical_projections.gnomonic import gpu
+from spherical_projections.gnomonic.config import GnomonicConfig
+from spherical_projections.gnomonic.strategy import GnomonicProjectionStrategy
+
+
+def make_strategy():
+    return GnomonicProjectionStrategy(GnomonicConfig(phi1_deg=25.0, lam0_deg=10.0, dtype=np.float64))
+
+
+def spherical_grid():
+    # Kept well inside the visible hemisphere so the masks do not depend on rounding at the horizon.
+    lon, lat = np.meshgrid(np.linspace(-30.0, 50.0, 48), np.linspace(-10.0, 60.0, 32))
+    return lat, lon
+
+
+def planar_grid():
+    x, y = np.meshgrid(np.linspace(-1.0, 1.0, 48), np.linspace(-0.8, 0.8, 32))
+    return x, y
+
+
+def assert_matches_numpy(proj, forward, inverse, to_numpy):
+    lat, lon = spherical_grid()
+    x, y = planar_grid()
+    expected_forward = proj.from_spherical_to_projection(lat, lon)
+    expected_inverse = proj.from_projection_to_spherical(x, y)
+    for result, expected in zip(forward(lat, lon), expected_forward):
+        np.testing.assert_allclose(to_numpy(result), expected, rtol=1e-9, atol=1e-9)
+    for result, expected in zip(inverse(x, y), expected_inverse):
+        np.testing.assert_allclose(to_numpy(result), expected, rtol=1e-9, atol=1e-9)
+
+
+def test_numpy_arrays_are_not_device_arrays():
+    assert gpu.array_backend(np.zeros(3)) == "numpy"
+    assert not gpu.is_device_array(np.zeros(3))
+
+
+def test_torch_cpu_tensors_use_numpy_path():
+    torch = pytest.importorskip("torch")
+    proj = make_strategy()
+    lat, lon = spherical_grid()
+    assert not gpu.is_device_array(torch.from_numpy(lat))
+    x, y, mask = proj.from_spherical_to_projection(torch.from_numpy(lat), torch.from_numpy(lon))
+    assert isinstance(x, np.ndarray)
+    np.testing.assert_array_equal(x, proj.from_spherical_to_projection(lat, lon)[0])
+
+
+def test_torch_functions_match_numpy():
+    # Runs the eager Torch equations on the CPU so they are checked without a GPU.
+    torch = pytest.importorskip("torch")
+    proj = make_strategy()
+    t, R = proj.config._trig, proj.config.R
+
+    def forward(lat, lon):
+        return gpu._torch_forward(torch.from_numpy(lat), torch.from_numpy(lon), t.sp, t.cp, t.lam0, R)
+
+    def inverse(x, y):
+        return gpu._torch_inverse(torch.from_numpy(x), torch.from_numpy(y), t.sp, t.cp, t.lam0, R)
+
+    assert_matches_numpy(proj, forward, inverse, lambda a: a.numpy())
+
+
+def test_torch_compiled_kernels_match_numpy():
+    # gpu.forward/inverse wrap the equations with torch.compile, which also runs on CPU tensors.
+    torch = pytest.importorskip("torch")
+    proj = make_strategy()
+    t, R = proj.config._trig, proj.config.R
+
+    def forward(lat, lon):
+        return gpu.forward(torch.from_numpy(lat), torch.from_numpy(lon), t, R)
+
+    def inverse(x, y):
+        return gpu.inverse(torch.from_numpy(x), torch.from_numpy(y), t, R)
+
+    assert_matches_numpy(proj, forward, inverse, lambda a: a.numpy())
+
+
+def test_torch_cuda_matches_numpy():
+    torch = pytest.importorskip("torch")
+    if not torch.cuda.is_available():
+        pytest.skip("CUDA is not available")
+    proj = make_strategy()
+
+    def to_device(a):
+        return torch.from_numpy(a).cuda()
+
+    assert gpu.is_device_array(to_device(np.zeros(3)))
+    assert_matches_numpy(
+        proj,
+        lambda lat, lon: proj.from_spherical_to_projection(to_device(lat), to_device(lon)),
+        lambda x, y: proj.from_projection_to_spherical(to_device(x), to_device(y)),
+        lambda a: a.cpu().numpy(),
+    )
+
+
+def test_cupy_matches_numpy():
+    cupy = pytest.importorskip("cupy")
+    try:
+        cupy.cuda.runtime.getDeviceCount()
+    except cupy.cuda.runtime.CUDARuntimeError:
+        pytest.skip("no CUDA device")
+    proj = make_strategy()
+
+    assert gpu.is_device_array(cupy.zeros(3))
+    assert_matches_numpy(
+        proj,
+        lambda lat, lon: proj.from_spherical_to_projection(cupy.asarray(lat), cupy.asarray(lon)),
+        lambda x, y: proj.from_projection_to_spherical(cupy.asarray(x), cupy.asarray(y)),
+        cupy.asnumpy,
+    )
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+import spherical_projections as sp
+from spherical_projections.base.mask import PackedMask
+from spherical_projections.gnomonic.config import GnomonicConfig
+from spherical_projections.gnomonic.strategy import GnomonicProjectionStrategy
+
+
+@pytest.mark.parametrize("shape", [(1,), (7,), (3, 9), (2, 5, 13), (4, 16)])
+def test_pack_unpack_round_trip(shape):
+    mask = np.random.default_rng(0).random(shape) > 0.5
+    packed = PackedMask.pack(mask)
+    assert packed.shape == shape
+    assert packed.bits.dtype == np.uint8
+    assert packed.bits.shape[-1] == (shape[-1] + 7) // 8
+    unpacked = packed.unpack()
+    assert unpacked.dtype == bool
+    np.testing.assert_array_equal(unpacked, mask)
+
+
+@pytest.mark.parametrize("value", [True, False])
+def test_pack_unpack_round_trip_0d(value):
+    mask = np.array(value)
+    packed = PackedMask.pack(mask)
+    assert packed.shape == ()
+    unpacked = packed.unpack()
+    assert unpacked.shape == () and unpacked.dtype == bool
+    assert unpacked == value
+
+
+def test_scalar_forward_projection_packs_mask():
+    proj = GnomonicProjectionStrategy(GnomonicConfig(pack_mask=True))
+    _, _, packed = proj.from_spherical_to_projection(10.0, 5.0)
+    assert isinstance(packed, PackedMask)
+    assert packed.unpack().shape == ()
+
+
+def test_backward_unpacks_mask_once(monkeypatch):
+    calls = []
+    unpack = PackedMask.unpack
+    monkeypatch.setattr(PackedMask, "unpack", lambda self: calls.append(self) or unpack(self))
+    processor = sp.ProjectionRegistry.get_projection(
+        "gnomonic", return_processor=True, pack_mask=True, x_points=16, y_points=16, lon_points=64, lat_points=32
+    )
+    rect = np.zeros((16, 16, 3), dtype=np.uint8)
+    img, mask = processor.backward(rect, return_mask=True)
+    assert len(calls) == 1
+    assert mask.shape == img.shape[:2] and mask.dtype == bool
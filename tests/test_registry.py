@@ -0,0 +1,51 @@
+import pytest
+
+from spherical_projections.base.config import BaseProjectionConfig
+from spherical_projections.default_projections import _lazy_components
+from spherical_projections.exceptions import RegistrationError
+from spherical_projections.registry import ProjectionRegistry
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    monkeypatch.setattr(ProjectionRegistry, "_registry", dict(ProjectionRegistry._registry))
+
+
+def gnomonic_loader(calls):
+    load = _lazy_components(
+        ".gnomonic",
+        ("GnomonicConfig", "GnomonicGridGeneration", "GnomonicProjectionStrategy", "GnomonicTransformer"),
+    )
+
+    def loader():
+        calls.append(1)
+        return load()
+    return loader
+
+
+def test_get_projection_resolves_lazy_entry_once():
+    calls = []
+    ProjectionRegistry.register("lazy_gnomonic", gnomonic_loader(calls))
+    assert "lazy_gnomonic" in ProjectionRegistry.list_projections()
+    assert not calls
+
+    config = ProjectionRegistry.get_projection("lazy_gnomonic", phi1_deg=10.0)
+    assert isinstance(config, BaseProjectionConfig)
+    assert not callable(ProjectionRegistry._registry["lazy_gnomonic"])
+    ProjectionRegistry.get_projection("lazy_gnomonic")
+    assert len(calls) == 1
+
+
+def test_failing_loader_raises_registration_error():
+    def loader():
+        raise ImportError("missing optional module")
+
+    ProjectionRegistry.register("broken", loader)
+    with pytest.raises(RegistrationError, match="missing optional module"):
+        ProjectionRegistry.get_projection("broken")
+
+
+def test_loader_returning_invalid_components_raises_registration_error():
+    ProjectionRegistry.register("incomplete", lambda: {"config": object})
+    with pytest.raises(RegistrationError):
+        ProjectionRegistry.get_projection("incomplete")
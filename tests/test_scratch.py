@@ -0,0 +1,45 @@
+import numpy as np
+
+import spherical_projections as sp
+from spherical_projections.base.scratch import ScratchPool
+from spherical_projections.gnomonic import strategy
+
+
+def test_get_reuses_buffer_for_same_shape_and_dtype():
+    pool = ScratchPool()
+    first = pool.get("x", (4, 5), np.float32)
+    assert pool.get("x", (4, 5), np.float32) is first
+    assert first.shape == (4, 5) and first.dtype == np.float32
+
+
+def test_get_replaces_buffer_when_shape_or_dtype_changes():
+    pool = ScratchPool()
+    first = pool.get("x", (4, 5), np.float32)
+    resized = pool.get("x", (6, 5), np.float32)
+    assert resized is not first and resized.shape == (6, 5)
+    recast = pool.get("x", (6, 5), np.float64)
+    assert recast.dtype == np.float64
+    assert len(pool._buffers) == 1
+
+
+def test_clear_releases_buffers():
+    pool = ScratchPool()
+    pool.get("x", (3,), np.float32)
+    pool.clear()
+    assert not pool._buffers
+
+
+def test_processor_pool_stays_bounded_across_overrides(monkeypatch):
+    monkeypatch.setattr(
+        strategy, "_FORWARD_KERNELS", dict.fromkeys(strategy._FORWARD_KERNELS, strategy._gnomonic_forward_numpy)
+    )
+    processor = sp.ProjectionRegistry.get_projection(
+        "gnomonic", return_processor=True, x_points=16, y_points=16, lon_points=64, lat_points=32
+    )
+    img = np.zeros((32, 64, 3), dtype=np.uint8)
+    sizes = []
+    for points in (16, 24, 32, 40):
+        rect = processor.forward(img, x_points=points, y_points=points)
+        processor.backward(rect, lon_points=2 * points, lat_points=points)
+        sizes.append(len(processor.projection.scratch._buffers))
+    assert len(set(sizes)) == 1